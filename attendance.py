@@ -1,7 +1,189 @@
 import datetime
 import json
+import logging
 import os
-from typing import Dict, List, Optional, Union
+import sqlite3
+import threading
+import time
+import weakref
+from bisect import bisect_left, bisect_right, insort
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+LOG = logging.getLogger(__name__)
+
+_IO_BUFFER_SIZE = 64 * 1024
+_DEFAULT_STATUS_OPTIONS = ["present", "absent", "late", "excused"]
+_SQLITE_MAX_PARAMS = 500
+
+
+def _fmt_date(t: time.struct_time) -> str:
+    """Format a struct_time as YYYY-MM-DD without going through strftime."""
+    return f"{t.tm_year:04d}-{t.tm_mon:02d}-{t.tm_mday:02d}"
+
+
+def _fmt_ts(t: time.struct_time) -> str:
+    """Format a struct_time as YYYY-MM-DD HH:MM:SS without going through strftime."""
+    return (f"{t.tm_year:04d}-{t.tm_mon:02d}-{t.tm_mday:02d} "
+            f"{t.tm_hour:02d}:{t.tm_min:02d}:{t.tm_sec:02d}")
+
+
+def _parse_status_entry(data: Union[str, Dict]) -> Optional[Tuple[str, str]]:
+    """Split a bulk entry (status string or {status, notes} dict) into (status, notes)."""
+    if isinstance(data, str):
+        return data, ""
+    if isinstance(data, dict):
+        return data.get("status", "present"), data.get("notes", "")
+    return None
+
+
+def _parse_date_key(value: str, name: str) -> datetime.date:
+    """Parse a zero-padded YYYY-MM-DD string, raising ValueError for anything else."""
+    try:
+        parsed = datetime.date.fromisoformat(value)
+    except (TypeError, ValueError):
+        parsed = None
+    if parsed is None or parsed.isoformat() != value:
+        raise ValueError(f"{name} must be a YYYY-MM-DD date, got {value!r}")
+    return parsed
+
+
+def _history_window(start_date: Optional[str], end_date: Optional[str]) -> Tuple[str, str]:
+    """
+    Resolve a history date range, defaulting to the 30 days before end_date (or today).
+    
+    Both bounds are validated once here because history lookups compare date
+    keys as strings, where a malformed bound would silently match nothing.
+    """
+    if not end_date:
+        end_date = _fmt_date(time.localtime())
+    end_d = _parse_date_key(end_date, "end_date")
+    if not start_date:
+        start_date = (end_d - datetime.timedelta(days=30)).isoformat()
+    _parse_date_key(start_date, "start_date")
+    return start_date, end_date
+
+
+def _attendance_rate(present: int, total: int) -> float:
+    """Percentage of total that was present, rounded to two decimals."""
+    if total > 0:
+        return round((present / total * 100), 2)
+    return 0
+
+
+def _daily_report(date_key: str, generated_at: str, total_students: int,
+                  recorded_students: int, status_counts: Dict[str, int]) -> Dict:
+    """Build a daily report dict; a date without records gets a message instead of stats."""
+    if not recorded_students:
+        return {
+            "date": date_key,
+            "generated_at": generated_at,
+            "message": "No records for this date",
+            "stats": {}
+        }
+    return {
+        "date": date_key,
+        "generated_at": generated_at,
+        "total_students": total_students,
+        "recorded_students": recorded_students,
+        "missing_records": total_students - recorded_students,
+        "stats": status_counts,
+        "attendance_rate": _attendance_rate(status_counts.get("present", 0), total_students)
+    }
+
+
+def _history_report(student_id: str, name: str, start_date: str, end_date: str,
+                    history: Dict[str, Dict], status_counts: Dict[str, int]) -> Dict:
+    """Build a student history result dict from the matched records and status counts."""
+    total_days = len(history)
+    return {
+        "student_id": student_id,
+        "name": name,
+        "start_date": start_date,
+        "end_date": end_date,
+        "total_days": total_days,
+        "stats": status_counts,
+        "attendance_rate": _attendance_rate(status_counts.get("present", 0), total_days),
+        "history": history
+    }
+
+
+def _write_json_file(file_path: str, data: Dict, compact: bool = True,
+                     sync: bool = False) -> None:
+    """
+    Atomically save data to a JSON file.
+    
+    The data is written to a temporary file which then replaces the target,
+    so a crash mid-write never leaves a truncated file behind.
+    
+    Args:
+        file_path: Destination path
+        data: JSON-serialisable data to write
+        compact: Write without indentation (pretty-print when False)
+        sync: fsync the temporary file before replacing the target
+    """
+    if orjson is not None:
+        mode = 'wb'
+        # Stringify non-str keys the way the json fallback does
+        option = orjson.OPT_NON_STR_KEYS
+        if not compact:
+            option |= orjson.OPT_INDENT_2
+        payload = orjson.dumps(data, option=option)
+    else:
+        mode = 'w'
+        if compact:
+            payload = json.dumps(data, separators=(",", ":"))
+        else:
+            payload = json.dumps(data, indent=2)
+            
+    # Unique per process and thread so concurrent writers never share it
+    tmp_path = f"{file_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        with open(tmp_path, mode, buffering=_IO_BUFFER_SIZE) as file:
+            file.write(payload)
+            if sync:
+                file.flush()
+                os.fsync(file.fileno())
+        os.replace(tmp_path, file_path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+class _PendingReports:
+    """
+    Reports that still need saving, kept apart from AttendanceSystem so the
+    garbage-collection/exit finalizer can flush them without referencing the
+    system itself.
+    """
+    
+    def __init__(self, reports_file: str, reports: Dict):
+        self.reports_file = reports_file
+        self.reports = reports
+        self.dirty = False
+    
+    def flush(self) -> None:
+        """Save the reports file if any report changed since the last save."""
+        if self.dirty:
+            _write_json_file(self.reports_file, self.reports)
+            self.dirty = False
+
+
+def _flush_pending_reports(pending: _PendingReports) -> None:
+    """Finalizer: flush pending reports, warning instead of raising on failure."""
+    try:
+        pending.flush()
+    except OSError as e:
+        LOG.warning("Could not save attendance reports to %s: %s", pending.reports_file, e)
 
 
 class AttendanceSystem:
@@ -38,10 +220,71 @@ class AttendanceSystem:
             "last_backup": None
         })
         
+        self._refresh_status_options()
+        
+        # Query indexes are built on first use by _build_indexes
+        self._by_student = None
+        self._student_months = None
+        self._daily_counts = None
+        
+        # Dates whose cached report is stale; reports are written out lazily by
+        # flush(), bulk_attendance, or a finalizer that runs when this instance
+        # is collected or at exit. The finalizer only holds the pending-reports
+        # state, so it never keeps this instance alive.
+        self._dirty_dates = set()
+        self._pending_reports = _PendingReports(self.reports_file, self.reports)
+        self._exit_hook = weakref.finalize(self, _flush_pending_reports, self._pending_reports)
+        
         # Perform auto backup check if enabled
+        self._last_backup_date = None
         if self.config.get("auto_backup", True):
             self._check_auto_backup()
     
+    def _refresh_status_options(self) -> None:
+        """Cache the configured status options for validation and report counts."""
+        self._status_options = tuple(self.config.get("status_options", _DEFAULT_STATUS_OPTIONS))
+        self._valid_statuses = frozenset(self._status_options)
+        self._status_template = dict.fromkeys(self._status_options, 0)
+    
+    def _build_indexes(self) -> None:
+        """
+        Build the query indexes from the loaded attendance records.
+        
+        _by_student maps each student to monthly chunks of sorted date keys,
+        with _student_months listing each student's months in order, so ranged
+        history lookups only scan the months they overlap. _daily_counts holds
+        rolling per-date status counts for daily reports. All are deferred so
+        that sessions which only mark attendance never pay for a full scan of
+        the records.
+        """
+        self._by_student = defaultdict(dict)
+        self._student_months = defaultdict(list)
+        self._daily_counts = defaultdict(Counter)
+        for date_key in sorted(self.attendance_records):
+            counts = self._daily_counts[date_key]
+            for student_id, record in self.attendance_records[date_key].items():
+                self._index_date(student_id, date_key)
+                counts[record["status"]] += 1
+    
+    def _index_date(self, student_id: str, date_key: str) -> None:
+        """Add a date key to the student's monthly chunk, keeping everything sorted."""
+        month = date_key[:7]
+        chunks = self._by_student[student_id]
+        dates = chunks.get(month)
+        if dates is None:
+            dates = chunks[month] = []
+            months = self._student_months[student_id]
+            if not months or months[-1] < month:
+                months.append(month)
+            else:
+                insort(months, month)
+                
+        # Dates mostly arrive in order, so appending is the common case
+        if not dates or dates[-1] < date_key:
+            dates.append(date_key)
+        else:
+            insort(dates, date_key)
+    
     def _load_json_file(self, file_path: str, default: Dict = None) -> Dict:
         """Load data from a JSON file or return default value if file doesn't exist."""
         if default is None:
@@ -49,7 +292,10 @@ class AttendanceSystem:
             
         if os.path.exists(file_path):
             try:
-                with open(file_path, 'r') as file:
+                if orjson is not None:
+                    with open(file_path, 'rb', buffering=_IO_BUFFER_SIZE) as file:
+                        return orjson.loads(file.read())
+                with open(file_path, 'r', buffering=_IO_BUFFER_SIZE) as file:
                     return json.load(file)
             except json.JSONDecodeError:
                 print(f"Error reading {file_path}, creating new file.")
@@ -57,27 +303,27 @@ class AttendanceSystem:
         else:
             return default
     
-    def _save_json_file(self, file_path: str, data: Dict) -> None:
-        """Save data to a JSON file with formatting."""
-        with open(file_path, 'w') as file:
-            json.dump(data, file, indent=2)
+    def _save_json_file(self, file_path: str, data: Dict, compact: bool = True,
+                        sync: bool = False) -> None:
+        """Atomically save data to a JSON file (see _write_json_file)."""
+        _write_json_file(file_path, data, compact=compact, sync=sync)
     
     def _check_auto_backup(self) -> None:
         """Check if backup is needed and perform it if necessary."""
-        today = datetime.datetime.now().strftime("%Y-%m-%d")
+        today = datetime.date.today()
         last_backup = self.config.get("last_backup")
         
         if not last_backup:
-            self._create_backup(today)
+            self._create_backup(today.isoformat())
             return
             
-        # Calculate days since last backup
-        last_date = datetime.datetime.strptime(last_backup, "%Y-%m-%d")
-        current_date = datetime.datetime.strptime(today, "%Y-%m-%d")
-        days_diff = (current_date - last_date).days
+        # Calculate days since last backup, parsing the stored date only once
+        if self._last_backup_date is None:
+            self._last_backup_date = datetime.date.fromisoformat(last_backup)
+        days_diff = (today - self._last_backup_date).days
         
         if days_diff >= self.config.get("backup_frequency_days", 7):
-            self._create_backup(today)
+            self._create_backup(today.isoformat())
     
     def _create_backup(self, date_str: str) -> None:
         """Create backup of all JSON data files."""
@@ -94,12 +340,12 @@ class AttendanceSystem:
             ("system_config.json", self.config)
         ]:
             backup_path = os.path.join(backup_dir, file_name)
-            with open(backup_path, 'w') as file:
-                json.dump(data, file, indent=2)
+            self._save_json_file(backup_path, data, compact=False)
                 
         # Update last backup date
         self.config["last_backup"] = date_str
-        self._save_json_file(self.config_file, self.config)
+        self._last_backup_date = None
+        self._save_json_file(self.config_file, self.config, sync=True)
         print(f"Created backup in {backup_dir}")
     
     def add_student(self, student_id: str, name: str, additional_info: Dict = None) -> bool:
@@ -121,7 +367,7 @@ class AttendanceSystem:
         # Create student record
         student_data = {
             "name": name,
-            "registration_date": datetime.datetime.now().strftime("%Y-%m-%d"),
+            "registration_date": _fmt_date(time.localtime()),
             "status": "active"
         }
         
@@ -162,7 +408,7 @@ class AttendanceSystem:
     def get_attendance_date_key(self, date: Optional[str] = None) -> str:
         """Generate a consistent date key for attendance records."""
         if date is None:
-            date = datetime.datetime.now().strftime("%Y-%m-%d")
+            date = _fmt_date(time.localtime())
         return date
     
     def mark_attendance(self, student_id: str, date: Optional[str] = None, 
@@ -179,33 +425,58 @@ class AttendanceSystem:
         Returns:
             Boolean indicating success
         """
-        date_key = self.get_attendance_date_key(date)
+        now = time.localtime()
+        date_key = date if date is not None else _fmt_date(now)
+        if not self._mark_attendance_nosave(student_id, date_key, status, notes, _fmt_ts(now)):
+            return False
             
+        # Save changes
+        self._save_json_file(self.attendance_file, self.attendance_records)
+        return True
+    
+    def _mark_attendance_nosave(self, student_id: str, date_key: str, status: str,
+                                notes: str, timestamp: str) -> bool:
+        """
+        Validate and record attendance in memory without writing to disk.
+        
+        The caller resolves date_key and formats the timestamp once, so batches
+        share them instead of re-reading the clock per student.
+        """
         # Validate student exists
         if student_id not in self.students:
             print(f"Error: Student ID {student_id} not found.")
             return False
         
         # Validate status is allowed
-        valid_statuses = self.config.get("status_options", ["present", "absent", "late", "excused"])
-        if status not in valid_statuses:
-            print(f"Error: Invalid status. Must be one of {valid_statuses}")
+        if status not in self._valid_statuses:
+            print(f"Error: Invalid status. Must be one of {list(self._status_options)}")
             return False
             
         # Ensure the date entry exists
         if date_key not in self.attendance_records:
             self.attendance_records[date_key] = {}
+        records = self.attendance_records[date_key]
+            
+        # Keep the per-student date index and per-date status counts in sync once built
+        if self._by_student is not None:
+            counts = self._daily_counts[date_key]
+            previous = records.get(student_id)
+            if previous is None:
+                self._index_date(student_id, date_key)
+            else:
+                counts[previous["status"]] -= 1
+            counts[status] += 1
+        self._dirty_dates.add(date_key)
             
         # Update the record
-        self.attendance_records[date_key][student_id] = {
+        records[student_id] = {
             "status": status,
-            "timestamp": datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            "timestamp": timestamp,
             "notes": notes
         }
         
-        # Save changes
-        self._save_json_file(self.attendance_file, self.attendance_records)
-        print(f"Marked {status} for {self.students[student_id]['name']} on {date_key}")
+        if LOG.isEnabledFor(logging.INFO):
+            LOG.info("Marked %s for %s on %s", status, self.students[student_id]["name"], date_key)
         return True
     
     def bulk_attendance(self, date: Optional[str] = None, 
@@ -220,81 +491,78 @@ class AttendanceSystem:
         Returns:
             Dictionary with results summary
         """
-        date_key = self.get_attendance_date_key(date)
+        now = time.localtime()
+        date_key = date if date is not None else _fmt_date(now)
+        timestamp = _fmt_ts(now)
         results = {"success": [], "failed": []}
             
         if not status_dict:
             print("No attendance data provided.")
             return results
             
+        # Bind per-iteration lookups to locals for the loop below
+        mark = self._mark_attendance_nosave
+        succeeded = results["success"].append
+        failed = results["failed"].append
+        
         for student_id, data in status_dict.items():
             # Handle both simple string status and dict with status and notes
-            if isinstance(data, str):
-                status = data
-                notes = ""
-            elif isinstance(data, dict):
-                status = data.get("status", "present")
-                notes = data.get("notes", "")
-            else:
+            entry = _parse_status_entry(data)
+            if entry is None:
                 print(f"Invalid data format for student {student_id}")
-                results["failed"].append(student_id)
+                failed(student_id)
                 continue
                 
-            # Mark attendance
-            success = self.mark_attendance(student_id, date_key, status, notes)
-            if success:
-                results["success"].append(student_id)
+            # Mark attendance (saved once below)
+            status, notes = entry
+            if mark(student_id, date_key, status, notes, timestamp):
+                succeeded(student_id)
             else:
-                results["failed"].append(student_id)
+                failed(student_id)
                 
-        # Generate a daily report after bulk update
+        # Save all changes in a single write
+        if results["success"]:
+            self._save_json_file(self.attendance_file, self.attendance_records)
+            
+        # Generate and save a daily report after bulk update
         self._generate_daily_report(date_key)
+        self._flush_reports()
         return results
     
     def _generate_daily_report(self, date_key: str) -> Dict:
         """Generate and save a report for the given date."""
-        if date_key not in self.attendance_records:
-            report = {
-                "date": date_key,
-                "generated_at": datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-                "message": "No records for this date",
-                "stats": {}
-            }
+        generated_at = _fmt_ts(time.localtime())
+        records = self.attendance_records.get(date_key)
+        if not records:
+            report = _daily_report(date_key, generated_at, len(self.students), 0, {})
         else:
-            records = self.attendance_records[date_key]
-            total_students = len(self.students)
-            recorded_students = len(records)
-            
-            # Count each status
-            status_counts = {}
-            for status in self.config.get("status_options", ["present", "absent", "late", "excused"]):
-                status_counts[status] = 0
-                
-            for student_id, data in records.items():
-                if data["status"] in status_counts:
-                    status_counts[data["status"]] += 1
-            
-            # Calculate metrics
-            attendance_rate = 0
-            if total_students > 0:
-                present_count = status_counts.get("present", 0)
-                attendance_rate = round((present_count / total_students * 100), 2)
-            
-            report = {
-                "date": date_key,
-                "generated_at": datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-                "total_students": total_students,
-                "recorded_students": recorded_students,
-                "missing_records": total_students - recorded_students,
-                "stats": status_counts,
-                "attendance_rate": attendance_rate
-            }
-        
-        # Save the report
+            # Read each status count from the rolling counters
+            if self._daily_counts is None:
+                self._build_indexes()
+            counts = self._daily_counts[date_key]
+            status_counts = {status: counts[status] for status in self._status_options}
+            report = _daily_report(date_key, generated_at, len(self.students),
+                                   len(records), status_counts)
+        
+        # Cache the report; the reports file is saved by flush()
         self.reports[date_key] = report
-        self._save_json_file(self.reports_file, self.reports)
+        self._dirty_dates.discard(date_key)
+        self._pending_reports.dirty = True
         return report
     
+    def _flush_reports(self) -> None:
+        """Save the reports file if any report changed since the last save."""
+        self._pending_reports.flush()
+    
+    def flush(self) -> None:
+        """Write any pending report changes to disk."""
+        self._flush_reports()
+    
+    def close(self) -> None:
+        """Flush pending reports and drop the exit hook for this instance."""
+        self._flush_reports()
+        self._exit_hook.detach()
+    
     def get_attendance_report(self, date: Optional[str] = None) -> Dict:
         """
         Get an attendance report for a specific date.
@@ -307,8 +575,8 @@ class AttendanceSystem:
         """
         date_key = self.get_attendance_date_key(date)
         
-        # Check if we already have a generated report
-        if date_key in self.reports:
+        # Reuse the generated report unless attendance changed since
+        if date_key in self.reports and date_key not in self._dirty_dates:
             return self.reports[date_key]
             
         # Generate a new report
@@ -327,62 +595,39 @@ class AttendanceSystem:
             
         Returns:
             Dictionary with the student's attendance history
+            
+        Raises:
+            ValueError: If a date bound is not a zero-padded YYYY-MM-DD date
         """
         if student_id not in self.students:
             return {"error": f"Student ID {student_id} not found."}
         
-        # Set default date range if not provided
-        if not end_date:
-            end_date = datetime.datetime.now().strftime("%Y-%m-%d")
-        if not start_date:
-            # Default to 30 days before end date
-            end_dt = datetime.datetime.strptime(end_date, "%Y-%m-%d")
-            start_dt = end_dt - datetime.timedelta(days=30)
-            start_date = start_dt.strftime("%Y-%m-%d")
-            
-        # Convert to datetime objects for comparison
-        start_dt = datetime.datetime.strptime(start_date, "%Y-%m-%d")
-        end_dt = datetime.datetime.strptime(end_date, "%Y-%m-%d")
+        start_date, end_date = _history_window(start_date, end_date)
             
+        # YYYY-MM-DD keys sort chronologically, so bisect the student's months
+        # and scan only the chunks that overlap the range
+        if self._by_student is None:
+            self._build_indexes()
+        chunks = self._by_student.get(student_id, {})
+        months = self._student_months.get(student_id, [])
+        start_month = start_date[:7]
+        end_month = end_date[:7]
         history = {}
-        for date_key, records in self.attendance_records.items():
-            # Skip dates outside range
-            try:
-                date_dt = datetime.datetime.strptime(date_key, "%Y-%m-%d")
-                if date_dt < start_dt or date_dt > end_dt:
-                    continue
-            except ValueError:
-                # Skip if date format is invalid
-                continue
-                
-            if student_id in records:
-                history[date_key] = records[student_id]
+        for month in months[bisect_left(months, start_month):bisect_right(months, end_month)]:
+            dates = chunks[month]
+            if month == start_month or month == end_month:
+                dates = dates[bisect_left(dates, start_date):bisect_right(dates, end_date)]
+            for date_key in dates:
+                history[date_key] = self.attendance_records[date_key][student_id]
                 
         # Calculate statistics
-        total_days = len(history)
-        status_counts = {}
-        for status in self.config.get("status_options", ["present", "absent", "late", "excused"]):
-            status_counts[status] = 0
-            
-        for date_key, record in history.items():
+        status_counts = self._status_template.copy()
+        for record in history.values():
             if record["status"] in status_counts:
                 status_counts[record["status"]] += 1
                 
-        # Calculate attendance rate
-        attendance_rate = 0
-        if total_days > 0:
-            attendance_rate = round((status_counts.get("present", 0) / total_days * 100), 2)
-                
-        return {
-            "student_id": student_id,
-            "name": self.students[student_id]["name"],
-            "start_date": start_date,
-            "end_date": end_date,
-            "total_days": total_days,
-            "stats": status_counts,
-            "attendance_rate": attendance_rate,
-            "history": history
-        }
+        return _history_report(student_id, self.students[student_id]["name"],
+                               start_date, end_date, history, status_counts)
     
     def export_monthly_report(self, year: int, month: int, 
                              format_type: str = "json") -> str:
@@ -415,21 +660,19 @@ class AttendanceSystem:
         # Prepare export data
         export_data = {
             "period": month_str,
-            "generated_at": datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            "generated_at": _fmt_ts(time.localtime()),
             "students": monthly_students,
             "attendance": monthly_data
         }
         
         # Create export directory if needed
         export_dir = os.path.join(self.data_directory, "exports")
-        if not os.path.exists(export_dir):
-            os.makedirs(export_dir)
+        os.makedirs(export_dir, exist_ok=True)
             
         # Export based on format
         if format_type.lower() == "json":
             export_path = os.path.join(export_dir, f"attendance_{month_str}.json")
-            with open(export_path, 'w') as file:
-                json.dump(export_data, file, indent=2)
+            self._save_json_file(export_path, export_data, compact=False)
         elif format_type.lower() == "csv":
             export_path = os.path.join(export_dir, f"attendance_{month_str}.csv")
             
@@ -445,24 +688,62 @@ class AttendanceSystem:
                 header = ["Student ID", "Name"] + all_dates
                 writer.writerow(header)
                 
-                # Write data for each student
-                for student_id, student_info in monthly_students.items():
-                    row = [student_id, student_info.get("name", "Unknown")]
-                    
-                    # Add status for each date
-                    for date in all_dates:
-                        if date in monthly_data and student_id in monthly_data[date]:
-                            row.append(monthly_data[date][student_id]["status"])
-                        else:
-                            row.append("N/A")
-                            
-                    writer.writerow(row)
+                # Fill a preallocated status matrix in one pass over the
+                # month's records, then emit every row in a single call
+                status_by_sid = {student_id: ["N/A"] * len(all_dates) for student_id in monthly_students}
+                for j, date in enumerate(all_dates):
+                    for student_id, record in monthly_data[date].items():
+                        status_by_sid[student_id][j] = record["status"]
+                writer.writerows([
+                    [student_id, student_info.get("name", "Unknown"), *status_by_sid[student_id]]
+                    for student_id, student_info in monthly_students.items()
+                ])
         else:
             return f"Unsupported format: {format_type}"
             
         print(f"Exported {month_str} attendance to {export_path}")
         return export_path
     
+    def export_range(self, year_start: int, month_start: int,
+                     year_end: int, month_end: int,
+                     format_type: str = "csv") -> List[str]:
+        """
+        Export every month in an inclusive range, one file per month.
+        
+        Months are independent and I/O-bound, so they are exported in parallel
+        on a thread pool.
+        
+        Args:
+            year_start: First year (e.g., 2025)
+            month_start: First month (1-12)
+            year_end: Last year
+            month_end: Last month (1-12)
+            format_type: Export format ('json' or 'csv')
+            
+        Returns:
+            List of exported file paths, in month order
+            
+        Raises:
+            ValueError: If either month is outside 1-12
+        """
+        for month in (month_start, month_end):
+            if not 1 <= month <= 12:
+                raise ValueError(f"Month must be between 1 and 12, got {month}")
+                
+        first = year_start * 12 + month_start - 1
+        last = year_end * 12 + month_end - 1
+        months = [divmod(index, 12) for index in range(first, last + 1)]
+        if not months:
+            return []
+            
+        with ThreadPoolExecutor(max_workers=min(len(months), os.cpu_count() or 1)) as executor:
+            return list(executor.map(
+                lambda year_month: self.export_monthly_report(
+                    year_month[0], year_month[1] + 1, format_type
+                ),
+                months
+            ))
+    
     def update_system_config(self, config_updates: Dict) -> bool:
         """
         Update system configuration parameters.
@@ -475,14 +756,260 @@ class AttendanceSystem:
         """
         for key, value in config_updates.items():
             self.config[key] = value
+        if "last_backup" in config_updates:
+            self._last_backup_date = None
+        if "status_options" in config_updates:
+            self._refresh_status_options()
             
-        self._save_json_file(self.config_file, self.config)
+        self._save_json_file(self.config_file, self.config, sync=True)
         print("Updated system configuration")
         return True
 
 
+class AttendanceStore:
+    """
+    SQLite-backed attendance storage for data sets that outgrow whole-file JSON rewrites.
+    
+    This is a separate, smaller API rather than a drop-in AttendanceSystem
+    replacement: it covers adding students, marking (single and bulk), daily
+    reports and student history, with the same return shapes, but has no
+    exports, student/config updates or backups. It does not read
+    system_config.json; pass status_options explicitly to match a JSON data
+    directory's configuration. Each mark is a single-row UPSERT and reports
+    are indexed aggregate queries.
+    """
+    
+    def __init__(self, db_path: str = os.path.join("attendance_data", "attendance.db"),
+                 status_options: Optional[List[str]] = None):
+        """
+        Open (or create) the SQLite attendance database.
+        
+        Args:
+            db_path: Path to the SQLite database file
+            status_options: Allowed attendance statuses (defaults to present/absent/late/excused)
+        """
+        directory = os.path.dirname(db_path)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory)
+            
+        self.db_path = db_path
+        self._status_options = tuple(status_options or _DEFAULT_STATUS_OPTIONS)
+        self._valid_statuses = frozenset(self._status_options)
+        
+        # Autocommit mode; WAL with synchronous=NORMAL keeps fsyncs to checkpoints
+        self.conn = sqlite3.connect(db_path, isolation_level=None)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS students (
+                id TEXT PRIMARY KEY,
+                name TEXT NOT NULL,
+                meta_json TEXT NOT NULL DEFAULT '{}'
+            );
+            CREATE TABLE IF NOT EXISTS attendance (
+                date TEXT NOT NULL,
+                sid TEXT NOT NULL,
+                status TEXT NOT NULL,
+                ts TEXT NOT NULL,
+                notes TEXT NOT NULL DEFAULT '',
+                PRIMARY KEY (date, sid)
+            );
+            CREATE INDEX IF NOT EXISTS attendance_sid_date ON attendance (sid, date);
+        """)
+    
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        self.conn.close()
+    
+    def _student_name(self, student_id: str) -> Optional[str]:
+        """Return the student's name, or None if the student does not exist."""
+        row = self.conn.execute("SELECT name FROM students WHERE id = ?", (student_id,)).fetchone()
+        return row[0] if row else None
+    
+    def _existing_student_ids(self, student_ids: List[str]) -> set:
+        """Return which of the given student IDs exist, in as few queries as possible."""
+        known = set()
+        # Stay well under SQLite's bound-parameter limit
+        for start in range(0, len(student_ids), _SQLITE_MAX_PARAMS):
+            chunk = student_ids[start:start + _SQLITE_MAX_PARAMS]
+            placeholders = ",".join("?" * len(chunk))
+            known.update(row[0] for row in self.conn.execute(
+                f"SELECT id FROM students WHERE id IN ({placeholders})", chunk
+            ))
+        return known
+    
+    def add_student(self, student_id: str, name: str, additional_info: Dict = None) -> bool:
+        """
+        Add a new student to the store.
+        
+        Args:
+            student_id: Unique identifier for the student
+            name: Full name of the student
+            additional_info: Optional dictionary of additional student information
+            
+        Returns:
+            Boolean indicating success
+        """
+        meta = {"registration_date": _fmt_date(time.localtime()), "status": "active"}
+        if additional_info:
+            meta.update(additional_info)
+            
+        cursor = self.conn.execute(
+            "INSERT OR IGNORE INTO students (id, name, meta_json) VALUES (?, ?, ?)",
+            (student_id, name, json.dumps(meta))
+        )
+        if cursor.rowcount == 0:
+            print(f"Student ID {student_id} already exists.")
+            return False
+        print(f"Added student: {name} (ID: {student_id})")
+        return True
+    
+    def mark_attendance(self, student_id: str, date: Optional[str] = None,
+                        status: str = "present", notes: str = "") -> bool:
+        """
+        Mark a student's attendance for a specific date.
+        
+        Args:
+            student_id: The student's unique identifier
+            date: Date string in YYYY-MM-DD format (defaults to today)
+            status: Attendance status ('present', 'absent', 'late', 'excused')
+            notes: Optional notes about the attendance record
+            
+        Returns:
+            Boolean indicating success
+        """
+        now = time.localtime()
+        date_key = date if date is not None else _fmt_date(now)
+        
+        name = self._student_name(student_id)
+        if name is None:
+            print(f"Error: Student ID {student_id} not found.")
+            return False
+        if status not in self._valid_statuses:
+            print(f"Error: Invalid status. Must be one of {list(self._status_options)}")
+            return False
+            
+        self.conn.execute(
+            "INSERT OR REPLACE INTO attendance VALUES (?, ?, ?, ?, ?)",
+            (date_key, student_id, status, _fmt_ts(now), notes)
+        )
+        if LOG.isEnabledFor(logging.INFO):
+            LOG.info("Marked %s for %s on %s", status, name, date_key)
+        return True
+    
+    def bulk_attendance(self, date: Optional[str] = None,
+                        status_dict: Dict[str, Union[str, Dict]] = None) -> Dict:
+        """
+        Mark attendance for multiple students in a single transaction.
+        
+        Args:
+            date: Date string in YYYY-MM-DD format (defaults to today)
+            status_dict: Dictionary mapping student IDs to status or {status, notes} dict
+            
+        Returns:
+            Dictionary with results summary
+        """
+        now = time.localtime()
+        date_key = date if date is not None else _fmt_date(now)
+        timestamp = _fmt_ts(now)
+        results = {"success": [], "failed": []}
+        
+        if not status_dict:
+            print("No attendance data provided.")
+            return results
+            
+        # Handle both simple string status and dict with status and notes
+        entries = [(student_id, _parse_status_entry(data)) for student_id, data in status_dict.items()]
+        known = self._existing_student_ids(
+            [student_id for student_id, entry in entries if entry is not None]
+        )
+        
+        rows = []
+        for student_id, entry in entries:
+            if entry is None:
+                print(f"Invalid data format for student {student_id}")
+                results["failed"].append(student_id)
+                continue
+                
+            status, notes = entry
+            if student_id not in known:
+                print(f"Error: Student ID {student_id} not found.")
+                results["failed"].append(student_id)
+            elif status not in self._valid_statuses:
+                print(f"Error: Invalid status. Must be one of {list(self._status_options)}")
+                results["failed"].append(student_id)
+            else:
+                rows.append((date_key, student_id, status, timestamp, notes))
+                results["success"].append(student_id)
+                
+        # One transaction, one commit for the whole batch
+        with self.conn:
+            self.conn.execute("BEGIN")
+            self.conn.executemany("INSERT OR REPLACE INTO attendance VALUES (?, ?, ?, ?, ?)", rows)
+        return results
+    
+    def get_attendance_report(self, date: Optional[str] = None) -> Dict:
+        """
+        Get an attendance report for a specific date.
+        
+        Args:
+            date: Date string in YYYY-MM-DD format (defaults to today)
+            
+        Returns:
+            Dictionary with attendance statistics
+        """
+        date_key = date if date is not None else _fmt_date(time.localtime())
+        generated_at = _fmt_ts(time.localtime())
+        
+        counts = dict(self.conn.execute(
+            "SELECT status, COUNT(*) FROM attendance WHERE date = ? GROUP BY status", (date_key,)
+        ).fetchall())
+        total_students = self.conn.execute("SELECT COUNT(*) FROM students").fetchone()[0]
+        status_counts = {status: counts.get(status, 0) for status in self._status_options}
+        return _daily_report(date_key, generated_at, total_students,
+                             sum(counts.values()), status_counts)
+    
+    def get_student_attendance_history(self, student_id: str,
+                                       start_date: Optional[str] = None,
+                                       end_date: Optional[str] = None) -> Dict:
+        """
+        Get the attendance history for a specific student within a date range.
+        
+        Args:
+            student_id: The student's unique identifier
+            start_date: Optional start date for the history (YYYY-MM-DD)
+            end_date: Optional end date for the history (YYYY-MM-DD)
+            
+        Returns:
+            Dictionary with the student's attendance history
+            
+        Raises:
+            ValueError: If a date bound is not a zero-padded YYYY-MM-DD date
+        """
+        name = self._student_name(student_id)
+        if name is None:
+            return {"error": f"Student ID {student_id} not found."}
+        
+        start_date, end_date = _history_window(start_date, end_date)
+            
+        history = {}
+        status_counts = dict.fromkeys(self._status_options, 0)
+        for date_key, status, timestamp, notes in self.conn.execute(
+            "SELECT date, status, ts, notes FROM attendance "
+            "WHERE sid = ? AND date BETWEEN ? AND ? ORDER BY date",
+            (student_id, start_date, end_date)
+        ):
+            history[date_key] = {"status": status, "timestamp": timestamp, "notes": notes}
+            if status in status_counts:
+                status_counts[status] += 1
+                
+        return _history_report(student_id, name, start_date, end_date, history, status_counts)
+
+
 # Example usage
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    
     # Initialize the system
     attendance = AttendanceSystem()
     
@@ -532,4 +1059,5 @@ if __name__ == "__main__":
     # Export monthly report
     current_month = datetime.datetime.now().month
     current_year = datetime.datetime.now().year
-    attendance.export_monthly_report(current_year, current_month)
\ No newline at end of file
+    attendance.export_monthly_report(current_year, current_month)
+    attendance.close()
\ No newline at end of file
@@ -4,22 +4,26 @@ import boto3
 bucket_name = 'shaik-test-code1'
 region = 'us-east-1'  # Change if needed
 
-# Create an S3 client
-s3_client = boto3.client('s3', region_name=region)
+# Shared session so repeated clients skip credential/region resolution
+SESSION = boto3.Session(region_name=region)
 
-try:
-    # Create the S3 bucket
-    response = s3_client.create_bucket(
-        Bucket=bucket_name,
-        CreateBucketConfiguration={
-            'LocationConstraint': region
-        }
-    )
-    print(f"Bucket '{bucket_name}' created successfully!")
-except s3_client.exceptions.BucketAlreadyOwnedByYou:
-    print(f"Bucket '{bucket_name}' already exists and is owned by you.")
-except s3_client.exceptions.BucketAlreadyExists:
-    print(f"Bucket name '{bucket_name}' is already taken.")
-except Exception as e:
-    print(f"Error: {e}"
-          
\ No newline at end of file
+
+if __name__ == "__main__":
+    # Create an S3 client
+    s3_client = SESSION.client('s3')
+
+    try:
+        # Create the S3 bucket
+        response = s3_client.create_bucket(
+            Bucket=bucket_name,
+            CreateBucketConfiguration={
+                'LocationConstraint': region
+            }
+        )
+        print(f"Bucket '{bucket_name}' created successfully!")
+    except s3_client.exceptions.BucketAlreadyOwnedByYou:
+        print(f"Bucket '{bucket_name}' already exists and is owned by you.")
+    except s3_client.exceptions.BucketAlreadyExists:
+        print(f"Bucket name '{bucket_name}' is already taken.")
+    except Exception as e:
+        print(f"Error: {e}")
@@ -0,0 +1,217 @@
+import gc
+import json
+import os
+import random
+import shutil
+import tempfile
+import unittest
+from collections import Counter
+
+from attendance import AttendanceSystem
+
+
+class AttendanceSystemTestCase(unittest.TestCase):
+    """Base case giving each test a fresh data directory."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.data_dir = os.path.join(self.tmp.name, "data")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def make_system(self, students=("S0", "S1", "S2")):
+        system = AttendanceSystem(self.data_dir)
+        for student_id in students:
+            if student_id not in system.students:
+                system.add_student(student_id, f"Student {student_id}")
+        return system
+
+    def load_reports(self):
+        with open(os.path.join(self.data_dir, "attendance_reports.json")) as file:
+            return json.load(file)
+
+
+class ReportPersistenceTest(AttendanceSystemTestCase):
+
+    def test_reports_saved_on_close(self):
+        system = self.make_system()
+        system.mark_attendance("S0", "2025-03-01", "present")
+        system.get_attendance_report("2025-03-01")
+        system.close()
+        self.assertEqual(self.load_reports()["2025-03-01"]["stats"]["present"], 1)
+
+    def test_reports_saved_when_collected(self):
+        def use_system():
+            system = self.make_system()
+            system.mark_attendance("S0", "2025-03-01", "late")
+            system.get_attendance_report("2025-03-01")
+
+        use_system()
+        gc.collect()
+        self.assertEqual(self.load_reports()["2025-03-01"]["stats"]["late"], 1)
+
+    def test_bulk_attendance_saves_reports(self):
+        system = self.make_system()
+        system.bulk_attendance("2025-03-02", {"S0": "present", "S1": "absent"})
+        self.assertEqual(self.load_reports()["2025-03-02"]["recorded_students"], 2)
+        system.close()
+
+    def test_missing_directory_warns_instead_of_raising(self):
+        def use_system():
+            system = self.make_system()
+            system.mark_attendance("S0", "2025-03-01", "present")
+            system.get_attendance_report("2025-03-01")
+            shutil.rmtree(self.data_dir)
+
+        with self.assertLogs("attendance", level="WARNING"):
+            use_system()
+            gc.collect()
+
+
+class IndexConsistencyTest(AttendanceSystemTestCase):
+    """Compare index-backed history and reports against a brute-force scan."""
+
+    STATUSES = ("present", "absent", "late", "excused")
+
+    def setUp(self):
+        super().setUp()
+        self.system = self.make_system()
+
+    def tearDown(self):
+        self.system.close()
+        super().tearDown()
+
+    def brute_history(self, student_id, start_date, end_date):
+        records = self.system.attendance_records
+        return {
+            date_key: records[date_key][student_id]
+            for date_key in sorted(records)
+            if start_date <= date_key <= end_date and student_id in records[date_key]
+        }
+
+    def assert_history_matches(self, student_id, start_date, end_date):
+        result = self.system.get_student_attendance_history(student_id, start_date, end_date)
+        expected = self.brute_history(student_id, start_date, end_date)
+        self.assertEqual(list(result["history"].items()), list(expected.items()))
+        counts = Counter(record["status"] for record in expected.values())
+        self.assertEqual(result["stats"], {status: counts[status] for status in self.STATUSES})
+
+    def assert_report_matches(self, date_key):
+        report = self.system.get_attendance_report(date_key)
+        records = self.system.attendance_records.get(date_key, {})
+        counts = Counter(record["status"] for record in records.values())
+        self.assertEqual(report.get("recorded_students", 0), len(records))
+        if records:
+            self.assertEqual(report["stats"], {status: counts[status] for status in self.STATUSES})
+
+    def test_remark_changes_status(self):
+        self.system.mark_attendance("S0", "2025-03-01", "present")
+        self.assert_report_matches("2025-03-01")
+        self.system.mark_attendance("S0", "2025-03-01", "late")
+        self.assert_report_matches("2025-03-01")
+        self.assert_history_matches("S0", "2025-03-01", "2025-03-31")
+        self.assertEqual(self.system.get_attendance_report("2025-03-01")["stats"]["present"], 0)
+
+    def test_out_of_order_date_after_build(self):
+        self.system.mark_attendance("S0", "2025-03-10", "present")
+        self.assert_history_matches("S0", "2025-03-01", "2025-03-31")
+        self.system.mark_attendance("S0", "2025-03-05", "absent")
+        self.system.mark_attendance("S0", "2025-03-20", "late")
+        self.assert_history_matches("S0", "2025-03-01", "2025-03-31")
+
+    def test_month_inserted_ahead_of_existing_months(self):
+        self.system.mark_attendance("S0", "2025-05-01", "present")
+        self.assert_history_matches("S0", "2025-01-01", "2025-12-31")
+        self.system.mark_attendance("S0", "2025-02-15", "absent")
+        self.system.mark_attendance("S0", "2025-04-30", "late")
+        self.assert_history_matches("S0", "2025-01-01", "2025-12-31")
+        self.assert_history_matches("S0", "2025-02-16", "2025-04-30")
+
+    def test_range_starts_and_ends_mid_month(self):
+        for date_key in ("2025-02-01", "2025-02-10", "2025-02-20", "2025-03-15",
+                         "2025-04-05", "2025-04-20", "2025-04-28"):
+            self.system.mark_attendance("S1", date_key, "present")
+        self.assert_history_matches("S1", "2025-02-10", "2025-04-20")
+        self.assert_history_matches("S1", "2025-02-11", "2025-04-19")
+        self.assert_history_matches("S1", "2025-03-01", "2025-03-31")
+        self.assert_history_matches("S1", "2025-03-16", "2025-04-04")
+
+    def test_marks_before_and_after_lazy_build(self):
+        self.system.mark_attendance("S0", "2025-03-02", "present")
+        self.system.mark_attendance("S0", "2025-03-02", "absent")
+        self.system.mark_attendance("S0", "2025-03-03", "late")
+        self.system.mark_attendance("S1", "2025-03-03", "present")
+        self.assertIsNone(self.system._by_student)
+
+        self.assert_history_matches("S0", "2025-03-01", "2025-03-31")
+        self.assert_report_matches("2025-03-02")
+        self.system.mark_attendance("S0", "2025-03-01", "excused")
+        self.system.bulk_attendance("2025-03-03", {"S0": "present", "S2": "absent"})
+        self.assert_history_matches("S0", "2025-03-01", "2025-03-31")
+        self.assert_report_matches("2025-03-03")
+
+        # A fresh instance builds its indexes from the saved records
+        self.system.close()
+        self.system = AttendanceSystem(self.data_dir)
+        self.assert_history_matches("S0", "2025-03-01", "2025-03-31")
+        self.assert_report_matches("2025-03-03")
+
+    def test_random_marks_match_brute_force(self):
+        rng = random.Random(2310)
+        dates = [f"2025-{month:02d}-{day:02d}" for month in range(1, 7) for day in (1, 9, 15, 28)]
+        students = ["S0", "S1", "S2"]
+        for step in range(300):
+            self.system.mark_attendance(rng.choice(students), rng.choice(dates), rng.choice(self.STATUSES))
+            if step % 25 == 0:
+                start_date, end_date = sorted(rng.sample(dates, 2))
+                self.assert_history_matches(rng.choice(students), start_date, end_date)
+                self.assert_report_matches(rng.choice(dates))
+        for student_id in students:
+            self.assert_history_matches(student_id, dates[0], dates[-1])
+        for date_key in dates:
+            self.assert_report_matches(date_key)
+
+
+class HistoryRangeTest(AttendanceSystemTestCase):
+
+    def test_default_window_is_thirty_days(self):
+        system = self.make_system()
+        system.mark_attendance("S0", "2025-03-01", "present")
+        history = system.get_student_attendance_history("S0", end_date="2025-03-15")
+        self.assertEqual(history["start_date"], "2025-02-13")
+        self.assertEqual(list(history["history"]), ["2025-03-01"])
+        system.close()
+
+    def test_rejects_malformed_dates(self):
+        system = self.make_system()
+        for start_date, end_date in (("2025-3-1", "2025-03-31"), ("2025-03-01", "20250331"),
+                                     ("2025-02-30", "2025-03-31")):
+            with self.assertRaises(ValueError):
+                system.get_student_attendance_history("S0", start_date, end_date)
+        system.close()
+
+
+class ExportRangeTest(AttendanceSystemTestCase):
+
+    def test_exports_each_month_in_range(self):
+        system = self.make_system()
+        system.mark_attendance("S0", "2024-12-05", "present")
+        paths = system.export_range(2024, 11, 2025, 2)
+        self.assertEqual([os.path.basename(path) for path in paths], [
+            "attendance_2024-11.csv", "attendance_2024-12.csv",
+            "attendance_2025-01.csv", "attendance_2025-02.csv",
+        ])
+        system.close()
+
+    def test_rejects_out_of_range_months(self):
+        system = self.make_system()
+        for bounds in ((2025, 0, 2025, 6), (2025, 1, 2025, 13)):
+            with self.assertRaises(ValueError):
+                system.export_range(*bounds)
+        self.assertFalse(os.path.exists(os.path.join(self.data_dir, "exports")))
+        system.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
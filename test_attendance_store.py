@@ -0,0 +1,81 @@
+import os
+import tempfile
+import unittest
+
+from attendance import AttendanceStore
+
+
+class AttendanceStoreTest(unittest.TestCase):
+    """Smoke tests for the SQLite-backed AttendanceStore."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self.tmp.name, "attendance.db")
+        self.store = AttendanceStore(self.db_path)
+        for i in range(3):
+            self.store.add_student(f"S{i}", f"Student {i}")
+
+    def tearDown(self):
+        self.store.close()
+        self.tmp.cleanup()
+
+    def test_add_student_rejects_duplicates(self):
+        self.assertFalse(self.store.add_student("S0", "Someone Else"))
+
+    def test_mark_attendance_validates_and_overwrites(self):
+        self.assertFalse(self.store.mark_attendance("S9", "2025-03-01"))
+        self.assertFalse(self.store.mark_attendance("S0", "2025-03-01", "bogus"))
+        self.assertTrue(self.store.mark_attendance("S0", "2025-03-01", "present"))
+        self.assertTrue(self.store.mark_attendance("S0", "2025-03-01", "late", "Bus delay"))
+
+        report = self.store.get_attendance_report("2025-03-01")
+        self.assertEqual(report["recorded_students"], 1)
+        self.assertEqual(report["stats"], {"present": 0, "absent": 0, "late": 1, "excused": 0})
+
+    def test_bulk_attendance_and_report(self):
+        results = self.store.bulk_attendance("2025-03-02", {
+            "S0": "present",
+            "S1": {"status": "absent", "notes": "Called in sick"},
+            "S9": "present",
+            "S2": "bogus",
+            "S3": 42,
+        })
+        self.assertEqual(results, {"success": ["S0", "S1"], "failed": ["S9", "S2", "S3"]})
+
+        report = self.store.get_attendance_report("2025-03-02")
+        self.assertEqual(report["total_students"], 3)
+        self.assertEqual(report["recorded_students"], 2)
+        self.assertEqual(report["missing_records"], 1)
+        self.assertEqual(report["stats"], {"present": 1, "absent": 1, "late": 0, "excused": 0})
+        self.assertEqual(report["attendance_rate"], 33.33)
+
+        empty = self.store.get_attendance_report("2025-04-01")
+        self.assertEqual(empty["message"], "No records for this date")
+
+    def test_bulk_attendance_many_students(self):
+        ids = [f"B{i}" for i in range(1200)]
+        for student_id in ids:
+            self.store.add_student(student_id, student_id)
+        results = self.store.bulk_attendance("2025-03-03", dict.fromkeys(ids, "present"))
+        self.assertEqual(len(results["success"]), len(ids))
+        self.assertEqual(self.store.get_attendance_report("2025-03-03")["stats"]["present"], len(ids))
+
+    def test_history_round_trip(self):
+        self.store.mark_attendance("S0", "2025-02-28", "present")
+        self.store.mark_attendance("S0", "2025-03-01", "late", "Bus delay")
+        self.store.mark_attendance("S0", "2025-03-05", "absent")
+        self.store.close()
+
+        # Reopen to check the data survives on disk
+        self.store = AttendanceStore(self.db_path)
+        history = self.store.get_student_attendance_history("S0", "2025-03-01", "2025-03-31")
+        self.assertEqual(list(history["history"]), ["2025-03-01", "2025-03-05"])
+        self.assertEqual(history["history"]["2025-03-01"]["notes"], "Bus delay")
+        self.assertEqual(history["total_days"], 2)
+        self.assertEqual(history["attendance_rate"], 0)
+
+        self.assertIn("error", self.store.get_student_attendance_history("S9"))
+
+
+if __name__ == "__main__":
+    unittest.main()